@@ -10,7 +10,6 @@ This version uses systemd timers for scheduling.
 
 import argparse
 import configparser
-import json
 import logging
 import os
 import pathlib
@@ -18,6 +17,7 @@ import shutil
 import subprocess
 import sys
 from datetime import datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 # Import the refactored core library API and exceptions
 try:
@@ -35,8 +35,9 @@ except ImportError as e:
     sys.exit(1)
 
 # --- Global Variables ---
-SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
-SCRIPT_PATH = str(pathlib.Path(__file__).resolve())
+_SCRIPT_FILE = pathlib.Path(__file__).resolve()
+SCRIPT_DIR = _SCRIPT_FILE.parent
+SCRIPT_PATH = str(_SCRIPT_FILE)
 PYTHON_EXECUTABLE = sys.executable
 DEPENDENCY_CHECKER_SCRIPT_NAME = "fluxfce_deps_check.py"
 TIMEZONES_JSON_PATH = SCRIPT_DIR / "fluxfce_core" / "assets" / "timezones.json"
@@ -198,7 +199,7 @@ def _interactive_setup() -> configparser.ConfigParser:
     log.info("First-time setup: No configuration file found.")
     log.info("Let's configure your location for sunrise/sunset calculations.")
     
-    config_obj = core_config.ConfigManager().load_config()
+    config_obj = core_config.get_config_manager().load_config()
     user_tz = None
 
     # 1. TIMEZONE
@@ -209,7 +210,6 @@ def _interactive_setup() -> configparser.ConfigParser:
         while True:
             try:
                 tz_input = input("Please enter your IANA timezone (e.g., America/Toronto, Europe/London): ").strip()
-                from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
                 ZoneInfo(tz_input)
                 user_tz = tz_input
                 break
@@ -223,6 +223,8 @@ def _interactive_setup() -> configparser.ConfigParser:
     # 2. COORDINATES (with suggestion from JSON)
     coords_set = False
     if TIMEZONES_JSON_PATH.exists() and user_tz:
+        import json  # Only needed for first-run setup; keeps CLI startup lean.
+
         try:
             with TIMEZONES_JSON_PATH.open("r", encoding="utf-8") as f:
                 tz_data = json.load(f)
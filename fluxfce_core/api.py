@@ -28,7 +28,7 @@ except ImportError:
 log = logging.getLogger(__name__)
 
 # --- Module-level Managers ---
-_cfg_mgr_api = cfg.ConfigManager()
+_cfg_mgr_api = cfg.get_config_manager()
 _sysd_mgr_api = sysd.SystemdManager()
 
 # --- Public API Functions for Config ---
@@ -139,15 +139,19 @@ def get_status() -> dict[str, Any]:
 
     # 1. Get Config
     try:
-        config_obj = get_current_config()
-        status["config"]["latitude"] = config_obj.get("Location", "LATITUDE", fallback="Not Set")
-        status["config"]["longitude"] = config_obj.get("Location", "LONGITUDE", fallback="Not Set")
-        status["config"]["timezone"] = config_obj.get("Location", "TIMEZONE", fallback="Not Set")
+        # Only read here, so the shared snapshot avoids building a parser.
+        # Its option names are lower-case, as ConfigParser stores them.
+        snapshot = _cfg_mgr_api.load_config_dict()
+        location = snapshot.get("Location", {})
+        appearance = snapshot.get("Appearance", {})
+        status["config"]["latitude"] = location.get("latitude", "Not Set")
+        status["config"]["longitude"] = location.get("longitude", "Not Set")
+        status["config"]["timezone"] = location.get("timezone", "Not Set")
         # Updated to new [Appearance] section
-        status["config"]["light_theme"] = config_obj.get("Appearance", "LIGHT_THEME", fallback="Not Set")
-        status["config"]["dark_theme"] = config_obj.get("Appearance", "DARK_THEME", fallback="Not Set")
-        status["config"]["day_bg_profile"] = config_obj.get("Appearance", "DAY_BACKGROUND_PROFILE", fallback="Not Set")
-        status["config"]["night_bg_profile"] = config_obj.get("Appearance", "NIGHT_BACKGROUND_PROFILE", fallback="Not Set")
+        status["config"]["light_theme"] = appearance.get("light_theme", "Not Set")
+        status["config"]["dark_theme"] = appearance.get("dark_theme", "Not Set")
+        status["config"]["day_bg_profile"] = appearance.get("day_background_profile", "Not Set")
+        status["config"]["night_bg_profile"] = appearance.get("night_background_profile", "Not Set")
     except exc.FluxFceError as e:
         status["config"]["error"] = str(e)
         log.error(f"API Status: Error loading config for status: {e}")
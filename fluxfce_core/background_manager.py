@@ -9,7 +9,6 @@ Its logic is heavily inspired by the xapply.py script.
 
 import logging
 import re
-import time
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +20,16 @@ log = logging.getLogger(__name__)
 # --- Configuration ---
 PROFILE_DIR = helpers.pathlib.Path.home() / ".config" / "fluxfce" / "backgrounds"
 
+# Parsed profiles keyed by path; each entry records the (mtime_ns, size, inode)
+# it was parsed from so edits on disk (including atomic replaces) are picked
+# up on the next load.
+_PROFILE_CACHE: dict[Path, tuple[tuple[int, int, int], list[dict[str, str]]]] = {}
+
+# Compiled per-monitor write plans, keyed by path. An entry is valid while it
+# was built from the very blocks list currently held in _PROFILE_CACHE.
+_WriteOp = tuple[str, str, str]  # (xfconf type or "rgba", property path, value)
+_PLAN_CACHE: dict[Path, tuple[list[dict[str, str]], tuple[_WriteOp, ...]]] = {}
+
 # --- Mappings for XFCE Properties ---
 IMAGE_STYLE_MAP = {
     "none": 0, "centered": 1, "tiled": 2, "stretched": 3,
@@ -31,6 +40,18 @@ COLOR_STYLE_MAP = {"solid": 0, "horizontal": 1, "vertical": 2}
 STYLE_IMAGE_MAP = {v: k for k, v in IMAGE_STYLE_MAP.items()}
 STYLE_COLOR_MAP = {v: k for k, v in COLOR_STYLE_MAP.items()}
 
+# Value types of the backdrop properties read through the GI channel; used to
+# pick the typed Xfconf getter since a property's type is not self-describing.
+_PROP_TYPES = {
+    "last-image": "string", "image-style": "int", "color-style": "int",
+    "rgba1": "array", "rgba2": "array",
+}
+
+# --- Precompiled Patterns ---
+_STRIP_WHITESPACE = str.maketrans("", "", " \t")
+_BLANK_LINE_RE = re.compile(r'\n\s*\n')
+_KV_RE = re.compile(r'^([^=\n]*)=(.*)$', re.MULTILINE)
+
 # --- Default Profile Content ---
 ASSETS_DIR = Path(__file__).resolve().parent / "assets"
 DEFAULT_DAY_ASSET = ASSETS_DIR / "default-day.png"
@@ -41,75 +62,301 @@ monitor=--span--
 type=image
 image_path={DEFAULT_DAY_ASSET}
 image_style=span
-"""
+""".strip()
 
 DEFAULT_NIGHT_PROFILE_CONTENT = f"""
 monitor=--span--
 type=image
 image_path={DEFAULT_NIGHT_ASSET}
 image_style=span
-"""
+""".strip()
+
+
+def _parse_settings(text: str) -> dict[str, str]:
+    """Parses 'key=value' lines into a dict; lines without '=' are ignored."""
+    return dict(_KV_RE.findall(text))
+
+
+def _xfconf_value_to_str(value: Any) -> str:
+    """Renders a GI xfconf value in the same shape xfconf-query prints it."""
+    if hasattr(value, "get_value"):  # GObject.Value wrapper
+        value = value.get_value()
+    if isinstance(value, (list, tuple)):
+        return "\n".join(_xfconf_value_to_str(v) for v in value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        # xfconf-query prints doubles with "%f" (0.100000, not 0.1); matching
+        # it keeps saved profiles identical whichever backend read them.
+        return f"{value:f}"
+    return str(value)
+
+
+def _parse_rgba_output(raw_output: str | None) -> str | None:
+    """Formats the numeric lines of an xfconf array value as 'rgba(a,b,c,d)'.
+
+    Non-numeric lines such as "Value is an array with 4 items:" are ignored.
+    """
+    if not raw_output:
+        return None
+    values = []
+    for line in raw_output.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            float(line)
+        except ValueError:
+            continue
+        values.append(line)
+    return f"rgba({','.join(values)})" if values else None
+
+
+def _workspaces_from_props(props: list[str]) -> list[str]:
+    """Collects the sorted, unique 'workspaceN' path segments from property paths."""
+    found = set()
+    for prop in props:
+        i = prop.find("/workspace")
+        if i < 0:
+            continue
+        j = prop.find("/", i + 1)
+        name = prop[i + 1:j] if j >= 0 else prop[i + 1:]
+        if name[9:].isdigit():  # len("workspace") == 9
+            found.add(name)
+    return sorted(found)
+
+
+_profile_dir_ready = False
+
+
+def _ensure_profile_dir() -> None:
+    """Creates PROFILE_DIR on first use; later calls cost no syscalls."""
+    global _profile_dir_ready
+    if _profile_dir_ready:
+        return
+    try:
+        PROFILE_DIR.stat()
+    except FileNotFoundError:
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    _profile_dir_ready = True
+
+
+def _read_profile(profile_path: Path) -> list[dict[str, str]]:
+    """Returns the settings blocks of a profile, reparsing only on change."""
+    st = profile_path.stat()
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    entry = _PROFILE_CACHE.get(profile_path)
+    if entry and entry[0] == key:
+        return entry[1]
+
+    return _cache_profile(profile_path, key, profile_path.read_text())
+
+
+def _cache_profile(profile_path: Path, key: tuple[int, int, int], content: str) -> list[dict[str, str]]:
+    """Parses profile content and stores it in _PROFILE_CACHE under key."""
+    blocks = [_parse_settings(block) for block in _BLANK_LINE_RE.split(content.strip()) if block.strip()]
+    _PROFILE_CACHE[profile_path] = (key, blocks)
+    return blocks
+
+
+def _write_profile(profile_path: Path, content: str) -> bool:
+    """Atomically writes a profile and primes the parse cache with its content.
+
+    Returns True if the file changed. The next load_profile of a profile we
+    wrote ourselves then needs only the validating stat, no read or parse.
+    """
+    written = helpers.write_text_atomic(profile_path, content)
+    if written:
+        st = profile_path.stat()
+        _cache_profile(profile_path, (st.st_mtime_ns, st.st_size, st.st_ino), content)
+    return written
+
+
+def _compile_write_plan(profile_name: str, blocks: list[dict[str, str]]) -> tuple[_WriteOp, ...]:
+    """Flattens per-monitor profile blocks into the exact xfconf writes they imply."""
+    plan: list[_WriteOp] = []
+    for settings in blocks:
+        monitor, workspace = settings.get("monitor"), settings.get("workspace")
+        if not monitor or not workspace:
+            log.warning(f"Skipping malformed block in profile '{profile_name}': {settings}")
+            continue
+
+        base_path = f"/backdrop/screen0/monitor{monitor}/{workspace}"
+        log.debug(f" -> Planning writes for: {monitor}/{workspace}")
+
+        if settings.get("type") == "image":
+            style_name = settings.get("image_style", "scaled")
+            style_id = IMAGE_STYLE_MAP.get(style_name, 4)
+            plan.append(("int", f"{base_path}/image-style", str(style_id)))
+            if "image_path" in settings:
+                plan.append(("string", f"{base_path}/last-image", settings["image_path"]))
+
+        elif settings.get("type") in ("solid_color", "gradient"):
+            plan.append(("int", f"{base_path}/image-style", str(IMAGE_STYLE_MAP["none"])))
+
+            if settings.get("type") == "solid_color":
+                plan.append(("int", f"{base_path}/color-style", str(COLOR_STYLE_MAP["solid"])))
+            else: # gradient
+                direction = settings.get("gradient_direction", "vertical")
+                style_id = COLOR_STYLE_MAP.get(direction, 2)
+                plan.append(("int", f"{base_path}/color-style", str(style_id)))
+
+            if "color1" in settings:
+                plan.append(("rgba", f"{base_path}/rgba1", settings["color1"]))
+            if "color2" in settings:
+                plan.append(("rgba", f"{base_path}/rgba2", settings["color2"]))
+    return tuple(plan)
+
+
+def _write_plan(profile_name: str, profile_path: Path, blocks: list[dict[str, str]]) -> tuple[_WriteOp, ...]:
+    """Returns the cached write plan for a profile, recompiling when it was reparsed."""
+    entry = _PLAN_CACHE.get(profile_path)
+    if entry and entry[0] is blocks:
+        return entry[1]
+    plan = _compile_write_plan(profile_name, blocks)
+    _PLAN_CACHE[profile_path] = (blocks, plan)
+    return plan
 
 
 class BackgroundManager:
     """Handles saving and loading of XFCE background profiles."""
 
     def __init__(self):
-        """Ensures the profile directory exists."""
+        """Ensures the profile directory exists and opens the xfconf channel."""
+        xfconf = helpers.get_xfconf()
         try:
+            # xfconf-query is always needed: all writes go through it.
             helpers.check_dependencies(["xfconf-query", "xrandr", "xfdesktop"])
-            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            _ensure_profile_dir()
         except (helpers.DependencyError, OSError) as e:
             raise XfceError(f"Cannot initialize BackgroundManager: {e}") from e
+        # In-process channel for reads when the GUI has GI bindings loaded,
+        # else xfconf-query. Writes always use xfconf-query, so they are committed
+        # before xfdesktop --reload runs (see helpers.get_xfconf).
+        self._channel = helpers.get_xfconf_channel("xfce4-desktop") if xfconf else None
+        # Memo of xfconf reads, populated only for the duration of a save pass.
+        self._prop_cache: dict[str, str | None] = {}
+        self._xrandr_cache: tuple[list[str], str | None] | None = None
+        # Snapshot of /backdrop/screen0 taken when a profile apply starts;
+        # scalar writes matching it are skipped.
+        self._current_values: dict[str, str] | None = None
 
     # --- Private Helpers for xfconf ---
     def _get_prop(self, prop_path: str) -> str | None:
+        prop_type = _PROP_TYPES.get(prop_path.rpartition("/")[2])
+        if self._channel is not None and prop_type:
+            if not self._channel.has_property(prop_path):
+                return None
+            if prop_type == "int":
+                return str(self._channel.get_int(prop_path, 0))
+            if prop_type == "array":
+                return _xfconf_value_to_str(self._channel.get_arrayv(prop_path) or [])
+            return self._channel.get_string(prop_path, "")
         cmd = ["xfconf-query", "-c", "xfce4-desktop", "-p", prop_path]
         ret_code, stdout, _ = helpers.run_command(cmd, capture=True)
         return stdout if ret_code == 0 else None
 
-    def _list_props(self, prop_path: str) -> list[str]:
-        cmd = ["xfconf-query", "-c", "xfce4-desktop", "-p", prop_path, "-l"]
+    def _get_prop_cached(self, prop_path: str) -> str | None:
+        """Returns a property value, querying xfconf at most once per pass."""
+        if prop_path not in self._prop_cache:
+            self._prop_cache[prop_path] = self._get_prop(prop_path)
+        return self._prop_cache[prop_path]
+
+    def _dump_props(self, prop_path: str) -> dict[str, str]:
+        """Returns {property: value} for a whole subtree in a single query."""
+        if self._channel is not None:
+            props = self._channel.get_properties(prop_path) or {}
+            return {path: _xfconf_value_to_str(value) for path, value in props.items()}
+        cmd = ["xfconf-query", "-c", "xfce4-desktop", "-p", prop_path, "-lv"]
         ret_code, stdout, _ = helpers.run_command(cmd, capture=True)
-        return stdout.splitlines() if ret_code == 0 else []
+        if ret_code != 0:
+            return {}
+        dump = {}
+        for line in stdout.splitlines():
+            path, _, value = line.partition(" ")
+            value = value.strip()
+            if value.startswith("[") and value.endswith("]"):
+                # Inline array rendering: one item per line, as with -p reads.
+                value = "\n".join(value[1:-1].split(","))
+            dump[path] = value
+        return dump
+
+    def _note_write(self, prop_path: str, value: str) -> None:
+        """Keeps the read caches coherent with a write that is about to be issued.
+
+        The pass-local read memo is evicted (a later read must see the new
+        value), while the apply snapshot is written through so repeated writes
+        of the same value within one apply are still skipped.
+        """
+        self._prop_cache.pop(prop_path, None)
+        if self._current_values is not None:
+            self._current_values[prop_path] = value
 
     def _set_prop(self, prop_path: str, prop_type: str, value: Any) -> None:
+        if self._current_values is not None and self._current_values.get(prop_path) == str(value):
+            log.debug(f"'{prop_path}' is already {value}, skipping write.")
+            return
+        self._note_write(prop_path, str(value))
         cmd = ["xfconf-query", "-c", "xfce4-desktop", "-p", prop_path, "--create", "-t", prop_type, "-s", str(value)]
         helpers.run_command(cmd)
 
     def _set_rgba_prop(self, prop_path: str, rgba_string: str) -> None:
-        match = re.search(r'rgba\(([\d.,\s]+)\)', rgba_string)
-        if not match:
+        start, end = rgba_string.find("("), rgba_string.rfind(")")
+        if start < 0 or end < start:
             log.warning(f"Could not parse RGBA string: {rgba_string}")
             return
         
-        values = [v.strip() for v in match.group(1).split(',')]
+        values = rgba_string[start + 1:end].translate(_STRIP_WHITESPACE).split(",")
         if len(values) != 4:
             log.warning(f"Invalid number of values in RGBA string: {rgba_string}")
             return
+        try:
+            for v in values:
+                float(v)
+        except ValueError:
+            log.warning(f"Could not parse RGBA string: {rgba_string}")
+            return
 
-        helpers.run_command(["xfconf-query", "-c", "xfce4-desktop", "-p", prop_path, "-r"], check=False)
+        self._note_write(prop_path, "\n".join(values))
+        helpers.run_command(["xfconf-query", "-c", "xfce4-desktop", "-p", prop_path, "-r"])
         cmd = ["xfconf-query", "-c", "xfce4-desktop", "-p", prop_path, "-n", "-t", "double", "-s", values[0], "-t", "double", "-s", values[1], "-t", "double", "-s", values[2], "-t", "double", "-s", values[3]]
         helpers.run_command(cmd)
         log.debug(f"Set RGBA property '{prop_path}' with values {values}")
 
     # --- Private Helpers for System Info ---
-    def _get_connected_monitors(self) -> list[str]:
+    def _parse_xrandr(self) -> tuple[list[str], str | None]:
+        """Runs xrandr once and returns (connected monitors, primary monitor).
+
+        The result is memoized until the next save/load operation starts, so a
+        single pass never forks xrandr more than once.
+        """
+        if self._xrandr_cache is not None:
+            return self._xrandr_cache
+
         ret_code, stdout, _ = helpers.run_command(["xrandr"], capture=True)
         if ret_code != 0 or not stdout:
             log.warning("Could not run xrandr to get monitor list.")
-            return []
-        return [line.split()[0] for line in stdout.splitlines() if " connected" in line]
+            return [], None
 
-    def _get_primary_monitor(self) -> str | None:
-        ret_code, stdout, _ = helpers.run_command(["xrandr"], capture=True)
-        if ret_code != 0 or not stdout:
-            return None
+        connected: list[str] = []
+        primary: str | None = None
         for line in stdout.splitlines():
-            if " primary " in line:
-                return line.split()[0]
-        monitors = self._get_connected_monitors()
-        return monitors[0] if monitors else None
+            if " connected" in line:
+                name = line.split()[0]
+                connected.append(name)
+                if primary is None and " primary " in line:
+                    primary = name
+        if primary is None and connected:
+            primary = connected[0]
+
+        self._xrandr_cache = (connected, primary)
+        return self._xrandr_cache
+
+    def _get_connected_monitors(self) -> list[str]:
+        return list(self._parse_xrandr()[0])
+
+    def _get_primary_monitor(self) -> str | None:
+        return self._parse_xrandr()[1]
 
     # --- Public API ---
     def install_default_profiles(self) -> None:
@@ -120,12 +367,15 @@ class BackgroundManager:
             return
             
         try:
-            day_profile_path = PROFILE_DIR / "default-day.profile"
-            day_profile_path.write_text(DEFAULT_DAY_PROFILE_CONTENT.strip())
-            night_profile_path = PROFILE_DIR / "default-night.profile"
-            night_profile_path.write_text(DEFAULT_NIGHT_PROFILE_CONTENT.strip())
-            log.info(f"Wrote default day profile to {day_profile_path}")
-            log.info(f"Wrote default night profile to {night_profile_path}")
+            for name, content in (
+                ("default-day", DEFAULT_DAY_PROFILE_CONTENT),
+                ("default-night", DEFAULT_NIGHT_PROFILE_CONTENT),
+            ):
+                profile_path = PROFILE_DIR / f"{name}.profile"
+                if _write_profile(profile_path, content):
+                    log.info(f"Wrote {name} profile to {profile_path}")
+                else:
+                    log.debug(f"{name} profile at {profile_path} is already up to date.")
         except OSError as e:
             raise XfceError(f"Failed to write default profiles: {e}") from e
 
@@ -140,145 +390,126 @@ class BackgroundManager:
         # which correctly handles all configurations.
         # --- END OF BUG FIX ---
 
-        profile_blocks = []
+        self._prop_cache.clear()
+        self._xrandr_cache = None
+        lines: list[str] = []
+        block_count = 0
         for monitor in self._get_connected_monitors():
             base_path = f"/backdrop/screen0/monitor{monitor}"
-            monitor_props = self._list_props(base_path)
-            if not monitor_props:
+            dump = self._dump_props(base_path)
+            if not dump:
                 log.debug(f"No backdrop properties found for monitor {monitor}, skipping.")
                 continue
             
-            workspaces = sorted(list(set(re.findall(r'(workspace\d+)', " ".join(monitor_props)))))
-            if not workspaces: workspaces = ['workspace0']
+            workspaces = _workspaces_from_props(list(dump)) or ['workspace0']
+            # Seed the per-pass cache from the dump; a property missing from the
+            # subtree dump is unset, so it is cached as None without a query.
+            for workspace in workspaces:
+                for leaf, kind in _PROP_TYPES.items():
+                    path = f"{base_path}/{workspace}/{leaf}"
+                    value = dump.get(path)
+                    # Arrays are seeded only if the dump rendered their items;
+                    # otherwise they are left for an individual read.
+                    if kind != "array" or value is None or _parse_rgba_output(value):
+                        self._prop_cache[path] = value
 
             for workspace in workspaces:
                 ws_path = f"{base_path}/{workspace}"
                 
-                def get_parsed_rgba_string(raw_output: str | None) -> str | None:
-                    """Parses xfconf-query output to extract only float values."""
-                    if not raw_output:
-                        return None
-                    
-                    values = []
-                    for line in raw_output.splitlines():
-                        line = line.strip()
-                        try:
-                            # Attempt to convert to float to validate it's a number
-                            float(line)
-                            values.append(line)
-                        except (ValueError, TypeError):
-                            # Ignore non-numeric lines like "Value is an array..." and empty lines
-                            continue
-                    
-                    # Only return a formatted string if we found valid values
-                    return f"rgba({','.join(values)})" if values else None
-
-                rgba1_raw = self._get_prop(f"{ws_path}/rgba1")
-                rgba1_str = get_parsed_rgba_string(rgba1_raw)
-                
-                rgba2_raw = self._get_prop(f"{ws_path}/rgba2")
-                rgba2_str = get_parsed_rgba_string(rgba2_raw)
-                # --- END OF BUG FIX ---
-
-                settings = {
-                    "image_path": self._get_prop(f"{ws_path}/last-image"),
-                    "image_style": self._get_prop(f"{ws_path}/image-style"),
-                    "color_style": self._get_prop(f"{ws_path}/color-style"),
-                    "rgba1": rgba1_str,
-                    "rgba2": rgba2_str,
-                }
-                
-                if not any(v for k, v in settings.items() if k not in ['rgba1', 'rgba2'] and v is not None):
+                # Read the scalar properties first; a workspace with none of them
+                # set is skipped before paying for the two array reads.
+                image_path = self._get_prop_cached(f"{ws_path}/last-image")
+                image_style_raw = self._get_prop_cached(f"{ws_path}/image-style")
+                color_style_raw = self._get_prop_cached(f"{ws_path}/color-style")
+                if not (image_path or image_style_raw or color_style_raw):
                     log.debug(f"No meaningful settings for {monitor}/{workspace}, skipping.")
                     continue
+
+                if lines:
+                    lines.append("\n")  # blank line between blocks
+                block_count += 1
+                lines += [f"monitor={monitor}\n", f"workspace={workspace}\n"]
+                image_style_name = STYLE_IMAGE_MAP.get(int(image_style_raw) if image_style_raw else -1, "none")
                 
-                block = [f"monitor={monitor}", f"workspace={workspace}"]
-                image_style_val = settings.get('image_style')
-                image_style_name = STYLE_IMAGE_MAP.get(int(image_style_val) if image_style_val else -1, "none")
-                
-                if settings.get('image_path') and image_style_name != "none":
-                    block.extend(["type=image", f"image_path={settings['image_path']}", f"image_style={image_style_name}"])
+                if image_path and image_style_name != "none":
+                    # Image workspaces never emit colors, so rgba1/rgba2 are not read.
+                    lines += ["type=image\n", f"image_path={image_path}\n", f"image_style={image_style_name}\n"]
                 else:
-                    color_style_val = settings.get('color_style')
-                    color_style_name = STYLE_COLOR_MAP.get(int(color_style_val) if color_style_val else 0, "solid")
+                    color_style_name = STYLE_COLOR_MAP.get(int(color_style_raw) if color_style_raw else 0, "solid")
+                    rgba1 = _parse_rgba_output(self._get_prop_cached(f"{ws_path}/rgba1"))
                     if color_style_name == "solid":
-                        block.append("type=solid_color")
-                        if settings['rgba1']: block.append(f"color1={settings['rgba1']}")
+                        lines.append("type=solid_color\n")
+                        if rgba1: lines.append(f"color1={rgba1}\n")
                     else:
-                        block.extend(["type=gradient", f"gradient_direction={color_style_name}"])
-                        if settings['rgba1']: block.append(f"color1={settings['rgba1']}")
-                        if settings['rgba2']: block.append(f"color2={settings['rgba2']}")
-                
-                profile_blocks.append("\n".join(block))
-
-        if profile_blocks:
-            profile_path.write_text("\n\n".join(profile_blocks) + "\n")
-            log.info(f"Profile saved to {profile_path} with {len(profile_blocks)} configuration block(s).")
+                        rgba2 = _parse_rgba_output(self._get_prop_cached(f"{ws_path}/rgba2"))
+                        lines += ["type=gradient\n", f"gradient_direction={color_style_name}\n"]
+                        if rgba1: lines.append(f"color1={rgba1}\n")
+                        if rgba2: lines.append(f"color2={rgba2}\n")
+
+        self._prop_cache.clear()
+
+        if lines:
+            try:
+                written = _write_profile(profile_path, "".join(lines))
+            except OSError as e:
+                raise XfceError(f"Failed to write background profile '{profile_name}': {e}") from e
+            if written:
+                log.info(f"Profile saved to {profile_path} with {block_count} configuration block(s).")
+            else:
+                log.info(f"Profile {profile_path} already matches the current desktop; not rewritten.")
         else:
             log.warning(f"No active background settings found to save for profile '{profile_name}'.")
 
     def load_profile(self, profile_name: str) -> None:
         """Loads a desktop background configuration from a profile file."""
         profile_path = PROFILE_DIR / f"{profile_name}.profile"
-        if not profile_path.is_file():
-            raise XfceError(f"Background profile '{profile_name}' not found at: {profile_path}")
-
         log.info(f"Applying background profile '{profile_name}'...")
-        content = profile_path.read_text()
+        self._xrandr_cache = None
+        try:
+            # The stat inside _read_profile doubles as the existence check.
+            blocks = _read_profile(profile_path)
+        except FileNotFoundError as e:
+            raise XfceError(f"Background profile '{profile_name}' not found at: {profile_path}") from e
+        except OSError as e:
+            raise XfceError(f"Failed to read background profile '{profile_name}': {e}") from e
+
+        self._current_values = self._dump_props("/backdrop/screen0")
+        try:
+            if blocks and blocks[0].get("monitor") == "--span--":
+                self._apply_span(profile_name, blocks[0])
+            else:
+                self._apply_per_monitor(profile_name, profile_path, blocks)
+            # Each xfconf-query write is committed before it exits, so the
+            # reload needs no settle delay.
+            log.debug("Reloading desktop to apply all changes...")
+            helpers.run_command(["xfdesktop", "--reload"])
+        finally:
+            self._current_values = None
+
+        log.info(f"Profile '{profile_name}' applied successfully.")
+
+    def _apply_span(self, profile_name: str, settings_map: dict[str, str]) -> None:
+        """Spans one image across all monitors from the primary's workspace0."""
+        log.info(f"Applying 'Span screens' profile: {profile_name}")
+        image_path = settings_map.get("image_path")
+        monitors, primary_monitor = self._parse_xrandr()
+        if not primary_monitor or not image_path:
+            raise XfceError("Primary monitor not found or image_path missing in span profile.")
         
-        if "monitor=--span--" in content:
-            log.info(f"Applying 'Span screens' profile: {profile_name}")
-            settings_map = dict(line.split('=', 1) for line in content.splitlines() if '=' in line)
-            image_path = settings_map.get("image_path")
-            primary_monitor = self._get_primary_monitor()
-            if not primary_monitor or not image_path:
-                raise XfceError("Primary monitor not found or image_path missing in span profile.")
-            
-            base_path = f"/backdrop/screen0/monitor{primary_monitor}/workspace0"
-            self._set_prop(f"{base_path}/image-style", "int", IMAGE_STYLE_MAP["span"])
-            self._set_prop(f"{base_path}/last-image", "string", image_path)
-
-            for monitor in self._get_connected_monitors():
-                if monitor != primary_monitor:
-                    other_base = f"/backdrop/screen0/monitor{monitor}/workspace0"
-                    self._set_prop(f"{other_base}/image-style", "int", IMAGE_STYLE_MAP["none"])
-        else:
-            log.debug(f"Applying per-monitor settings for profile: {profile_name}")
-            blocks = re.split(r'\n\s*\n', content.strip())
-            for block in blocks:
-                if not block.strip(): continue
-                settings = dict(line.split('=', 1) for line in block.splitlines() if '=' in line)
-                monitor, workspace = settings.get("monitor"), settings.get("workspace")
-                if not monitor or not workspace:
-                    log.warning(f"Skipping malformed block in profile '{profile_name}': {block}")
-                    continue
-                
-                base_path = f"/backdrop/screen0/monitor{monitor}/{workspace}"
-                log.debug(f" -> Applying to: {monitor}/{workspace}")
-                
-                if settings.get("type") == "image":
-                    style_name = settings.get("image_style", "scaled")
-                    style_id = IMAGE_STYLE_MAP.get(style_name, 4)
-                    self._set_prop(f"{base_path}/image-style", "int", style_id)
-                    if "image_path" in settings:
-                         self._set_prop(f"{base_path}/last-image", "string", settings["image_path"])
-
-                elif settings.get("type") in ("solid_color", "gradient"):
-                    self._set_prop(f"{base_path}/image-style", "int", IMAGE_STYLE_MAP["none"])
-                    
-                    if settings.get("type") == "solid_color":
-                        self._set_prop(f"{base_path}/color-style", "int", COLOR_STYLE_MAP["solid"])
-                    else: # gradient
-                        direction = settings.get("gradient_direction", "vertical")
-                        style_id = COLOR_STYLE_MAP.get(direction, 2)
-                        self._set_prop(f"{base_path}/color-style", "int", style_id)
-
-                    if "color1" in settings:
-                        self._set_rgba_prop(f"{base_path}/rgba1", settings["color1"])
-                    if "color2" in settings:
-                        self._set_rgba_prop(f"{base_path}/rgba2", settings["color2"])
-
-        log.debug("Reloading desktop to apply all changes...")
-        time.sleep(0.2)
-        helpers.run_command(["xfdesktop", "--reload"])
-        log.info(f"Profile '{profile_name}' applied successfully.")
\ No newline at end of file
+        base_path = f"/backdrop/screen0/monitor{primary_monitor}/workspace0"
+        self._set_prop(f"{base_path}/image-style", "int", IMAGE_STYLE_MAP["span"])
+        self._set_prop(f"{base_path}/last-image", "string", image_path)
+
+        for monitor in monitors:
+            if monitor != primary_monitor:
+                other_base = f"/backdrop/screen0/monitor{monitor}/workspace0"
+                self._set_prop(f"{other_base}/image-style", "int", IMAGE_STYLE_MAP["none"])
+
+    def _apply_per_monitor(self, profile_name: str, profile_path: Path, blocks: list[dict[str, str]]) -> None:
+        """Applies each monitor/workspace block of a per-monitor profile."""
+        log.debug(f"Applying per-monitor settings for profile: {profile_name}")
+        for kind, prop_path, value in _write_plan(profile_name, profile_path, blocks):
+            if kind == "rgba":
+                self._set_rgba_prop(prop_path, value)
+            else:
+                self._set_prop(prop_path, kind, value)
@@ -7,10 +7,15 @@ for FluxFCE's configuration file (`config.ini`).
 """
 
 import configparser
+import io
 import logging
 import pathlib
-from typing import Optional
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from . import helpers
 from .exceptions import ConfigError
 
 log = logging.getLogger(__name__)
@@ -22,7 +27,7 @@ CONFIG_FILE = CONFIG_DIR / "config.ini"
 
 # Default configuration values
 # Background settings are now handled by profiles.
-DEFAULT_CONFIG: dict[str, dict[str, str]] = {
+_DEFAULT_CONFIG: dict[str, dict[str, str]] = {
     "Location": {
         "LATITUDE": "43.65N",
         "LONGITUDE": "79.38W",
@@ -48,62 +53,336 @@ DEFAULT_CONFIG: dict[str, dict[str, str]] = {
     },
 }
 
+# Read-only view of the defaults, so importers cannot mutate them in place.
+DEFAULT_CONFIG: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {section: MappingProxyType(options) for section, options in _DEFAULT_CONFIG.items()}
+)
+
+# Parser pre-populated with DEFAULT_CONFIG, from which the default key index,
+# value dict and rendered file below are derived. Interpolation is disabled
+# for every parser here: no value uses %-substitution, and BasicInterpolation
+# would otherwise rescan every value on each get().
+_DEFAULT_PARSER = configparser.ConfigParser(interpolation=None)
+_DEFAULT_PARSER.read_dict(DEFAULT_CONFIG)
+
+# (section, option names) for every default section, options as stored
+# (lower-case). Only ever iterated, so a flat tuple rather than a dict.
+_DEFAULT_KEYS: tuple[tuple[str, frozenset[str]], ...] = tuple(
+    (section, frozenset(_DEFAULT_PARSER.options(section))) for section in _DEFAULT_PARSER.sections()
+)
+
+# Loaded, default-merged configs keyed by path, as plain
+# {section: {option: value}} dicts, each validated against the file's
+# (st_mtime_ns, st_size, st_ino); None as the key means the file was absent.
+# The inode changes on every atomic save (os.replace), so a rewrite is caught
+# even when mtime and size happen to match. Dicts rather than parsers, since
+# read_dict() into a fresh parser is far cheaper than deep-copying one.
+_CACHE: dict[pathlib.Path, tuple[Optional[tuple[int, int, int]], dict[str, dict[str, str]]]] = {}
+
+
+# Read-only {section: {option: value}} views, validated like _CACHE.
+_SNAPSHOTS: dict[pathlib.Path, tuple[Optional[tuple[int, int, int]], Mapping[str, Mapping[str, str]]]] = {}
+_EMPTY_SECTION: Mapping[str, str] = MappingProxyType({})
+
+# Values derived from the config (parsed location, ZoneInfo),
+# memoized per file version and validated like _CACHE.
+_DERIVED: dict[pathlib.Path, tuple[Optional[tuple[int, int, int]], dict[str, Any]]] = {}
+
+
+# Set once CONFIG_DIR has been created; see ConfigManager._ensure_dir().
+_config_dir_ready = False
+
+
+def invalidate_cache() -> None:
+    """Drops all cached configs so the next load re-reads from disk."""
+    _CACHE.clear()
+    _SNAPSHOTS.clear()
+    _DERIVED.clear()
+
+
+def get_setting_fast(
+    snapshot: Mapping[str, Mapping[str, str]], section: str, key: str, default: Optional[str] = None
+) -> Optional[str]:
+    """Looks up a value in a load_config_dict() snapshot with plain dict access."""
+    return snapshot.get(section, _EMPTY_SECTION).get(key.lower(), default)
+
+
+def _stat_key(file_path: pathlib.Path) -> Optional[tuple[int, int, int]]:
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        raise ConfigError(f"Could not read config file {file_path}: {e}") from e
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _has_all_defaults(parser: configparser.ConfigParser) -> bool:
+    """True if the parser already holds every default section and option."""
+    return all(
+        parser.has_section(section) and keys.issubset(parser.options(section))
+        for section, keys in _DEFAULT_KEYS
+    )
+
+
+def _as_dict(parser: configparser.ConfigParser) -> dict[str, dict[str, str]]:
+    """
+    Returns a parser's stored (raw) values as {section: {option: value}}.
+
+    A [DEFAULT] section is kept as its own entry rather than folded into
+    every section, so read_dict() and write() round-trip it unchanged.
+    """
+    defaults = parser.defaults()
+    data = {parser.default_section: dict(defaults)} if defaults else {}
+    for section in parser.sections():
+        # options() lists the section's own keys first, in file order.
+        options = {key: parser.get(section, key, raw=True) for key in parser.options(section)}
+        data[section] = {
+            key: value for key, value in options.items() if key not in defaults or defaults[key] != value
+        }
+    return data
+
+
+def _with_defaults(data: dict[str, dict[str, str]]) -> dict[str, dict[str, str]]:
+    """Layers values over the defaults, in the order read_dict() would."""
+    merged = {section: dict(options) for section, options in _DEFAULT_DATA.items()}
+    for section, options in data.items():
+        merged.setdefault(section, {}).update(options)
+    return merged
+
+
+def _config_key() -> Optional[tuple[int, int, int]]:
+    """Returns CONFIG_FILE's current stat key, so every load sees external edits."""
+    return _stat_key(CONFIG_FILE)
+
+
+def _render_ini(parser: configparser.ConfigParser) -> str:
+    """Renders a parser with ConfigParser.write(), as one string."""
+    buf = io.StringIO()
+    parser.write(buf)
+    return buf.getvalue()
+
+
+# The defaults as _as_dict() returns them (lower-case option names).
+_DEFAULT_DATA = _as_dict(_DEFAULT_PARSER)
+
+# config.ini exactly as a save of the pure defaults writes it; see _load_ini().
+_DEFAULT_TEXT = _render_ini(_DEFAULT_PARSER)
+
+
 class ConfigManager:
     """Handles reading/writing config.ini."""
     
-    def __init__(self):
+    def _ensure_dir(self) -> None:
+        # The config directory is only created when something is written
+        # (reading a missing config simply yields the defaults), and at most
+        # once per process, whichever ConfigManager does it.
+        global _config_dir_ready
+        if _config_dir_ready:
+            return
         try:
             CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-            log.debug(f"Configuration directory ensured: {CONFIG_DIR}")
+            log.debug("Configuration directory ensured: %s", CONFIG_DIR)
         except OSError as e:
             raise ConfigError(f"Failed to create configuration directory {CONFIG_DIR}: {e}") from e
+        _config_dir_ready = True
 
-    def _load_ini(self, file_path: pathlib.Path) -> configparser.ConfigParser:
-        parser = configparser.ConfigParser()
-        if file_path.exists():
-            try:
-                if file_path.stat().st_size > 0:
-                    parser.read(file_path, encoding="utf-8")
-                else:
-                    log.warning(f"Config file {file_path} is empty.")
-            except configparser.Error as e:
-                raise ConfigError(f"Could not parse config file {file_path}: {e}") from e
-            except OSError as e:
-                raise ConfigError(f"Could not read config file {file_path}: {e}") from e
+    def _load_ini(
+        self, file_path: pathlib.Path, parser: Optional[configparser.ConfigParser] = None
+    ) -> configparser.ConfigParser:
+        if parser is None:
+            parser = configparser.ConfigParser(interpolation=None)
+        # A single open() replaces the exists()/stat() probes.
+        try:
+            with file_path.open("r", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            log.debug("Config file %s not found; using defaults.", file_path)
+            return parser
+        except OSError as e:
+            raise ConfigError(f"Could not read config file {file_path}: {e}") from e
+
+        if not text:
+            log.warning(f"Config file {file_path} is empty.")
+            return parser
+        if text == _DEFAULT_TEXT:
+            # Untouched default config: copy the known values over instead
+            # of running the line parser on the text.
+            parser.read_dict(_DEFAULT_CONFIG)
+            return parser
+        try:
+            parser.read_string(text, source=str(file_path))
+        except configparser.Error as e:
+            raise ConfigError(f"Could not parse config file {file_path}: {e}") from e
         return parser
 
     def _save_ini(self, parser: configparser.ConfigParser, file_path: pathlib.Path) -> bool:
+        self._ensure_dir()
         try:
-            with file_path.open("w", encoding="utf-8") as f:
-                parser.write(f)
-            log.debug(f"Saved configuration to {file_path}")
+            # Written via a temp file + os.replace(), so a crash mid-save can
+            # never leave a truncated config.ini behind.
+            if helpers.write_text_atomic(file_path, _render_ini(parser)):
+                log.debug("Saved configuration to %s", file_path)
+            else:
+                log.debug("Configuration at %s unchanged; nothing written.", file_path)
             return True
         except OSError as e:
             raise ConfigError(f"Failed to write configuration to {file_path}: {e}") from e
 
-    def load_config(self) -> configparser.ConfigParser:
+    def _read_config(self, key: Optional[tuple[int, int, int]]) -> configparser.ConfigParser:
+        """Reads config.ini, caches its values merged with the defaults, and returns the parser."""
         parser = self._load_ini(CONFIG_FILE)
-        made_changes = False
-        for section, defaults in DEFAULT_CONFIG.items():
-            if not parser.has_section(section):
-                parser.add_section(section)
-                made_changes = True
-            for key, value in defaults.items():
-                if not parser.has_option(section, key):
-                    parser.set(section, key, value)
-                    made_changes = True
-        if made_changes:
-            log.info("Default values applied in memory to the loaded configuration.")
+        data = _with_defaults(_as_dict(parser))
+        _CACHE[CONFIG_FILE] = (key, data)
+        # Defaults are merged as dicts; the parser only needs rebuilding when
+        # the file actually lacked some (reading them in costs a set() each).
+        if not _has_all_defaults(parser):
+            parser = configparser.ConfigParser(interpolation=None)
+            parser.read_dict(data)
         return parser
 
+    def _load_data(self) -> dict[str, dict[str, str]]:
+        """Returns the cached, default-merged values, re-reading the file if it changed."""
+        key = _config_key()
+        entry = _CACHE.get(CONFIG_FILE)
+        if entry and entry[0] == key:
+            return entry[1]
+        self._read_config(key)
+        return _CACHE[CONFIG_FILE][1]
+
+    def load_config(self) -> configparser.ConfigParser:
+        """
+        Returns the config with defaults applied.
+
+        The parsed values are cached per file version; each caller gets a
+        fresh parser built from them, so mutating it never affects the cache.
+        """
+        key = _config_key()
+        entry = _CACHE.get(CONFIG_FILE)
+        if entry and entry[0] == key:
+            parser = configparser.ConfigParser(interpolation=None)
+            parser.read_dict(entry[1])
+            return parser
+        return self._read_config(key)
+
+    def load_config_dict(self) -> Mapping[str, Mapping[str, str]]:
+        """
+        Returns an immutable {section: {option: value}} snapshot of the config.
+
+        The snapshot is shared by all callers and rebuilt only when the file
+        changes, so read-only lookups skip ConfigParser entirely. Option names
+        are lower-case, as ConfigParser stores them; use get_setting_fast().
+        """
+        key = _config_key()
+        entry = _SNAPSHOTS.get(CONFIG_FILE)
+        if entry and entry[0] == key:
+            return entry[1]
+        data = self._load_data()
+        # Resolve [DEFAULT] into each section, as ConfigParser lookups do.
+        defaults = data.get(configparser.DEFAULTSECT, {})
+        snapshot = MappingProxyType(
+            {
+                section: MappingProxyType({**defaults, **options})
+                for section, options in data.items()
+                if section != configparser.DEFAULTSECT
+            }
+        )
+        _SNAPSHOTS[CONFIG_FILE] = (key, snapshot)
+        return snapshot
+
+    def _derived(self) -> dict[str, Any]:
+        """Returns the memo of derived values for the current file version."""
+        key = _config_key()
+        entry = _DERIVED.get(CONFIG_FILE)
+        if entry is None or entry[0] != key:
+            entry = (key, {})
+            _DERIVED[CONFIG_FILE] = entry
+        return entry[1]
+
+    def get_location(self) -> tuple[float, float, str]:
+        """
+        Returns the configured (latitude, longitude, timezone).
+
+        Coordinates are parsed to floats once per file version, so repeated
+        callers skip the string parsing until config.ini changes.
+
+        Raises:
+            ConfigError: If any of the three values is missing.
+            ValidationError: If a coordinate is malformed.
+        """
+        derived = self._derived()
+        location = derived.get("location")
+        if location is not None:
+            return location
+
+        snapshot = self.load_config_dict()
+        lat_str = get_setting_fast(snapshot, "Location", "latitude", "")
+        lon_str = get_setting_fast(snapshot, "Location", "longitude", "")
+        tz_name = get_setting_fast(snapshot, "Location", "timezone", "")
+        if not all([lat_str, lon_str, tz_name]) or "Not Set" in (lat_str, lon_str, tz_name):
+            raise ConfigError("Location (latitude, longitude, timezone) not fully configured.")
+
+        location = (
+            helpers.latlon_str_to_float(lat_str),
+            helpers.latlon_str_to_float(lon_str),
+            tz_name,
+        )
+        derived["location"] = location
+        return location
+
+    def get_zoneinfo(self) -> ZoneInfo:
+        """
+        Returns the configured timezone as a ZoneInfo, memoized per file version.
+
+        Raises:
+            ConfigError: If the timezone is missing or unknown.
+        """
+        derived = self._derived()
+        tzinfo = derived.get("zoneinfo")
+        if tzinfo is not None:
+            return tzinfo
+
+        tz_name = get_setting_fast(self.load_config_dict(), "Location", "timezone", "")
+        try:
+            tzinfo = ZoneInfo(tz_name)
+        except (ZoneInfoNotFoundError, ValueError) as e:
+            raise ConfigError(f"Invalid timezone in configuration: '{tz_name}'") from e
+        derived["zoneinfo"] = tzinfo
+        return tzinfo
+
     def save_config(self, config: configparser.ConfigParser) -> bool:
         log.info(f"Saving configuration to {CONFIG_FILE}")
-        return self._save_ini(config, CONFIG_FILE)
+        try:
+            saved = self._save_ini(config, CONFIG_FILE)
+        finally:
+            invalidate_cache()
+        # Seed the cache with what was just written, layered over the
+        # defaults exactly as a load would, so the next load skips the read.
+        # Raw values are taken, as those are what was written. A parser that
+        # already has every default (anything from load_config()) is taken as-is.
+        primed = _as_dict(config)
+        if not _has_all_defaults(config):
+            primed = _with_defaults(primed)
+        _CACHE[CONFIG_FILE] = (_config_key(), primed)
+        return saved
 
     def get_setting(self, config: configparser.ConfigParser, section: str, key: str, default: Optional[str] = None) -> Optional[str]:
         return config.get(section, key, fallback=default)
 
     def set_setting(self, config: configparser.ConfigParser, section: str, key: str, value: str):
-        if not config.has_section(section):
+        try:
+            config.set(section, key, value)
+        except configparser.NoSectionError:
             config.add_section(section)
-        config.set(section, key, value)
\ No newline at end of file
+            config.set(section, key, value)
+
+# --- Shared instance ---
+_manager: Optional[ConfigManager] = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Returns the process-wide ConfigManager, creating it on first use."""
+    global _manager
+    if _manager is None:
+        _manager = ConfigManager()
+    return _manager
@@ -9,17 +9,43 @@ for themes/screen and the BackgroundManager for desktop backgrounds.
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Literal
+from zoneinfo import ZoneInfo
 
 from . import config as cfg
-from . import helpers, xfce
+from . import helpers, sun, xfce
 from .background_manager import BackgroundManager
 from .exceptions import FluxFceError, ValidationError
 
 log = logging.getLogger(__name__)
 
-_cfg_mgr_desktop = cfg.ConfigManager()
+_cfg_mgr_desktop = cfg.get_config_manager()
+
+# Config keys used for each mode.
+_MODE_KEYS = {
+    "day": {"theme": "LIGHT_THEME", "bg_profile": "DAY_BACKGROUND_PROFILE", "screen_section": "ScreenDay"},
+    "night": {"theme": "DARK_THEME", "bg_profile": "NIGHT_BACKGROUND_PROFILE", "screen_section": "ScreenNight"},
+}
+
+# Created on first use and then reused: constructing them probes dependencies
+# and opens xfconf channels, and their per-operation state is reset by each
+# operation anyway. Lazy, so importing this module never requires XFCE tools.
+_xfce_handler: xfce.XfceHandler | None = None
+_bg_manager: BackgroundManager | None = None
+
+def _get_xfce_handler() -> xfce.XfceHandler:
+    global _xfce_handler
+    if _xfce_handler is None:
+        _xfce_handler = xfce.XfceHandler()
+    return _xfce_handler
+
+def _get_bg_manager() -> BackgroundManager:
+    global _bg_manager
+    if _bg_manager is None:
+        _bg_manager = BackgroundManager()
+    return _bg_manager
 
 def _load_cfg() -> cfg.configparser.ConfigParser:
     """Return the current config (with in-memory defaults)."""
@@ -27,18 +53,17 @@ def _load_cfg() -> cfg.configparser.ConfigParser:
 
 def _apply_single_mode(mode: Literal["day", "night"]) -> bool:
     """Low-level worker that performs all appearance changes."""
-    conf = _load_cfg()
+    conf = _cfg_mgr_desktop.load_config_dict()
     
-    theme_key = "LIGHT_THEME" if mode == "day" else "DARK_THEME"
-    bg_profile_key = "DAY_BACKGROUND_PROFILE" if mode == "day" else "NIGHT_BACKGROUND_PROFILE"
-    screen_section = "ScreenDay" if mode == "day" else "ScreenNight"
+    keys = _MODE_KEYS[mode]
+    screen_section = keys["screen_section"]
 
-    theme_to_set = conf.get("Appearance", theme_key)
-    bg_profile_to_load = conf.get("Appearance", bg_profile_key)
+    theme_to_set = cfg.get_setting_fast(conf, "Appearance", keys["theme"])
+    bg_profile_to_load = cfg.get_setting_fast(conf, "Appearance", keys["bg_profile"])
     
     # --- Apply settings ---
-    xfce_handler = xfce.XfceHandler()
-    bg_manager = BackgroundManager()
+    xfce_handler = _get_xfce_handler()
+    bg_manager = _get_bg_manager()
 
     # 1. GTK Theme
     if theme_to_set:
@@ -56,8 +81,8 @@ def _apply_single_mode(mode: Literal["day", "night"]) -> bool:
     try:
         # --- START: CORRECTED CODE BLOCK ---
         # First, get the string values, defaulting to None if the option doesn't exist.
-        temp_str = conf.get(screen_section, "XSCT_TEMP", fallback=None)
-        bright_str = conf.get(screen_section, "XSCT_BRIGHT", fallback=None)
+        temp_str = cfg.get_setting_fast(conf, screen_section, "XSCT_TEMP")
+        bright_str = cfg.get_setting_fast(conf, screen_section, "XSCT_BRIGHT")
 
         # Convert to numbers ONLY if the string value is not None and not empty.
         # This correctly handles cases where the config key exists but its value is blank.
@@ -84,14 +109,14 @@ def apply_mode(mode: Literal["day", "night"]) -> bool:
 
 def set_defaults_from_current(mode: Literal["day", "night"]) -> bool:
     """Save the current XFCE look as the new default for the given mode."""
-    conf = _load_cfg()
-    xfce_handler = xfce.XfceHandler()
-    bg_manager = BackgroundManager()
-    changed = False
+    snapshot = _cfg_mgr_desktop.load_config_dict()
+    xfce_handler = _get_xfce_handler()
+    bg_manager = _get_bg_manager()
+
+    mode_keys = _MODE_KEYS[mode]
+    profile_to_save = cfg.get_setting_fast(snapshot, "Appearance", mode_keys["bg_profile"])
 
     # 1. Save Background to Profile
-    profile_key = "DAY_BACKGROUND_PROFILE" if mode == "day" else "NIGHT_BACKGROUND_PROFILE"
-    profile_to_save = conf.get("Appearance", profile_key)
     if profile_to_save:
         log.info(f"Saving current background to profile: '{profile_to_save}'")
         bg_manager.save_current_to_profile(profile_to_save)
@@ -99,42 +124,44 @@ def set_defaults_from_current(mode: Literal["day", "night"]) -> bool:
         log.warning(f"No background profile name configured for {mode} mode; cannot save background.")
 
     # 2. Save Theme and Screen settings to config.ini
-    theme_key = "LIGHT_THEME" if mode == "day" else "DARK_THEME"
-    screen_section = "ScreenDay" if mode == "day" else "ScreenNight"
+    theme_key = mode_keys["theme"]
+    screen_section = mode_keys["screen_section"]
 
     current_theme = xfce_handler.get_gtk_theme()
-    if conf.get("Appearance", theme_key) != current_theme:
-        _cfg_mgr_desktop.set_setting(conf, "Appearance", theme_key, current_theme)
-        changed = True
-
     current_screen = xfce_handler.get_screen_settings()
     new_temp = "" if current_screen["temperature"] is None else str(current_screen["temperature"])
     new_bright = "" if current_screen["brightness"] is None else f"{current_screen['brightness']:.2f}"
-    
-    if conf.get(screen_section, "XSCT_TEMP", fallback="") != new_temp:
-        _cfg_mgr_desktop.set_setting(conf, screen_section, "XSCT_TEMP", new_temp)
-        changed = True
-    if conf.get(screen_section, "XSCT_BRIGHT", fallback="") != new_bright:
-        _cfg_mgr_desktop.set_setting(conf, screen_section, "XSCT_BRIGHT", new_bright)
-        changed = True
-
-    if changed:
+
+    # Diff plain dicts; the editable config is only loaded if something changed.
+    keys = (("Appearance", theme_key), (screen_section, "XSCT_TEMP"), (screen_section, "XSCT_BRIGHT"))
+    before = {k: cfg.get_setting_fast(snapshot, *k, "") for k in keys}
+    after = dict(zip(keys, (current_theme, new_temp, new_bright)))
+
+    if before != after:
+        conf = _load_cfg()
+        for (section, key), value in after.items():
+            if before[(section, key)] != value:
+                _cfg_mgr_desktop.set_setting(conf, section, key, value)
         log.info(f"Theme/Screen defaults updated for {mode} mode — saving config.ini")
         return _cfg_mgr_desktop.save_config(conf)
 
     log.info("Theme/Screen configuration already matches the current desktop; nothing to save to config.ini.")
     return True
 
-def determine_current_period(conf: cfg.configparser.ConfigParser) -> Literal["day", "night"]:
-    """Determines if it is currently day or night based on sun times."""
-    from zoneinfo import ZoneInfo
-    from . import sun
+def determine_current_period(conf: Mapping[str, Mapping[str, str]]) -> Literal["day", "night"]:
+    """
+    Determines if it is currently day or night based on sun times.
+
+    `conf` may be a ConfigParser or a load_config_dict() snapshot.
+    """
     try:
-        lat = helpers.latlon_str_to_float(conf.get("Location", "LATITUDE"))
-        lon = helpers.latlon_str_to_float(conf.get("Location", "LONGITUDE"))
-        tz_name = conf.get("Location", "TIMEZONE")
-        tzinfo = ZoneInfo(tz_name)
-        now = datetime.now(tzinfo)
+        # Lower-case option names work for both: SectionProxy lower-cases
+        # lookups, and snapshots store the names lower-cased.
+        loc = conf["Location"]
+        lat = helpers.latlon_str_to_float(loc["latitude"])
+        lon = helpers.latlon_str_to_float(loc["longitude"])
+        tz_name = loc["timezone"]
+        now = datetime.now(ZoneInfo(tz_name))
         times = sun.get_sun_times(lat, lon, now.date(), tz_name)
         return "day" if times["sunrise"] <= now < times["sunset"] else "night"
     except Exception as e:
@@ -153,7 +180,7 @@ def handle_internal_apply(mode: Literal["day", "night"]) -> bool:
 def handle_run_login_check() -> bool:
     """Called on login/resume to apply the correct theme for the current time."""
     log.info("DesktopManager: Handling 'run-login-check'...")
-    conf = _load_cfg()
+    conf = _cfg_mgr_desktop.load_config_dict()
     mode_to_apply = determine_current_period(conf)
     log.info(f"Login/resume check determined mode '{mode_to_apply}'. Applying now.")
     return apply_mode(mode_to_apply)
\ No newline at end of file
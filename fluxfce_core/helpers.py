@@ -11,13 +11,17 @@ modules within `fluxfce_core`. These include utilities for:
 - Basic library logging setup.
 """
 
+import functools
 import logging
 import os
 import pathlib
 import re
 import shutil
+import stat
 import subprocess
-from typing import Optional
+import sys
+import tempfile
+from typing import Any, Optional
 
 try:
     from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -113,8 +117,122 @@ def run_command(
         ) from e
 
 
+# --- File Writing ---
+
+
+def write_text_atomic(path: pathlib.Path, content: str) -> bool:
+    """
+    Writes content to path via a temporary file and os.replace().
+
+    Readers never observe a half-written file, and the data is fsync'ed
+    before the rename. A symlinked path has its target replaced. If the file already holds exactly this content,
+    nothing is written at all.
+
+    Returns:
+        True if the file was (re)written, False if it was already up to date.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    # Replace the link's target, not the link itself, so symlinked
+    # (e.g. dotfile-managed) files stay symlinks.
+    path = path.resolve()
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+
+    # A unique temp name, so concurrent writers (e.g. the GUI and a
+    # systemd-run CLI) never write into each other's temp file.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    tmp_path = pathlib.Path(tmp_name)
+    try:
+        # mkstemp creates the file 0600; keep the mode a plain open() gave:
+        # the existing file's, or 0666 minus the umask for a new file.
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.fchmod(fd, mode)
+        with open(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            # Make the data durable before the rename publishes it, so a
+            # crash can't leave an empty file under the real name.
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+# --- Optional Xfconf Bindings ---
+
+_xfconf_checked = False
+_xfconf_module: Any = None
+
+
+def get_xfconf() -> Any:
+    """
+    Returns the initialised GObject-Introspection Xfconf module, or None.
+
+    Only used when the process has already imported `gi` (the GUI): for a
+    short-lived CLI run, importing gi and the `Xfconf.init()` D-Bus round-trip
+    cost more than the few `xfconf-query` spawns they would replace. The
+    import and init are attempted once per process. When the bindings are
+    missing (or the xfconf daemon is unreachable) callers fall back to
+    spawning `xfconf-query`. The bindings are used for reads only: their
+    writes are asynchronous, so callers write through `xfconf-query`.
+    """
+    global _xfconf_checked, _xfconf_module
+    if "gi" not in sys.modules:
+        return None
+    if not _xfconf_checked:
+        _xfconf_checked = True
+        try:
+            import gi
+
+            gi.require_version("Xfconf", "0")
+            from gi.repository import Xfconf
+
+            Xfconf.init()
+            _xfconf_module = Xfconf
+            log.debug("Using GI Xfconf bindings for xfconf access.")
+        except Exception as e:  # ImportError, ValueError or GLib.Error
+            log.debug(f"GI Xfconf bindings unavailable, using xfconf-query: {e}")
+    return _xfconf_module
+
+
+_xfconf_channels: dict[str, Any] = {}
+
+
+def get_xfconf_channel(channel_name: str) -> Any:
+    """
+    Returns a shared GI Xfconf channel for channel_name, or None without GI.
+
+    Channels are opened once per process and reused by every handler, so
+    repeated XfceHandler/BackgroundManager construction does no GI work.
+    """
+    channel = _xfconf_channels.get(channel_name)
+    if channel is None:
+        xfconf = get_xfconf()
+        if xfconf is None:
+            return None
+        channel = _xfconf_channels[channel_name] = xfconf.Channel.get(channel_name)
+    return channel
+
+
 # --- Dependency Checks ---
 
+# Commands already located in PATH; only successes are remembered so a tool
+# installed while the process runs is still picked up on the next check.
+_found_dependencies: set[str] = set()
+
+
 
 def check_dependencies(deps: list[str]) -> bool:
     """
@@ -132,8 +250,12 @@ def check_dependencies(deps: list[str]) -> bool:
     log.debug(f"Checking for dependencies: {', '.join(deps)}")
     missing = []
     for dep in deps:
+        if dep in _found_dependencies:
+            continue
         if shutil.which(dep) is None:  # shutil.which returns None if not found
             missing.append(dep)
+        else:
+            _found_dependencies.add(dep)
 
     if missing:
         error_msg = (
@@ -332,11 +454,18 @@ def detect_system_timezone() -> Optional[str]:
 
 # --- Data Validation ---
 
+_LATLON_RE = re.compile(r"^(\d+(\.\d+)?)([NSEW])$")
+_HEX6_RE = re.compile(r"^[0-9a-fA-F]{6}$")
 
+
+@functools.lru_cache(maxsize=32)
 def latlon_str_to_float(coord_str: str) -> float:
     """
     Converts Lat/Lon string (e.g., '43.65N', '79.38W') to float degrees.
 
+    Results are memoized: the function is pure and is called with the same
+    few config values over and over. Invalid input raises and is not cached.
+
     Args:
         coord_str: The coordinate string to parse.
 
@@ -352,7 +481,7 @@ def latlon_str_to_float(coord_str: str) -> float:
         )
 
     coord_strip = coord_str.strip().upper()
-    match = re.match(r"^(\d+(\.\d+)?)([NSEW])$", coord_strip)
+    match = _LATLON_RE.match(coord_strip)
     if not match:
         raise ValidationError(
             f"Invalid coordinate format: '{coord_str}'. Use format like '43.65N' or '79.38W'."
@@ -404,14 +533,12 @@ def hex_to_rgba_doubles(hex_color: str) -> list[float]:
         )
 
     hex_strip = hex_color.lstrip("#")
-    if not re.match(r"^[0-9a-fA-F]{6}$", hex_strip):
+    if not _HEX6_RE.match(hex_strip):
         raise ValidationError(f"Invalid 6-digit hex color format: '{hex_color}'")
 
     try:
-        r = int(hex_strip[0:2], 16) / 255.0
-        g = int(hex_strip[2:4], 16) / 255.0
-        b = int(hex_strip[4:6], 16) / 255.0
-        rgba = [r, g, b, 1.0]  # R, G, B, Alpha
+        r, g, b = bytes.fromhex(hex_strip)
+        rgba = [r / 255.0, g / 255.0, b / 255.0, 1.0]  # R, G, B, Alpha
         log.debug(f"Converted hex '{hex_color}' to RGBA {rgba}")
         return rgba
     except ValueError as e:
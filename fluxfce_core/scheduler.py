@@ -13,17 +13,11 @@ from typing import Optional
 # Imports from within fluxfce_core
 from . import config as cfg 
 from . import exceptions as exc
-from . import helpers, sun, systemd as sysd 
-
-# For type hinting configparser object if passed directly
-import configparser 
+from . import sun, systemd as sysd 
 
 # zoneinfo needed for sun time calculations here
 try:
-    from zoneinfo import (
-        ZoneInfo,
-        ZoneInfoNotFoundError,
-    )
+    from zoneinfo import ZoneInfo
 except ImportError:
     raise ImportError(
         "Required module 'zoneinfo' not found. FluxFCE requires Python 3.9+."
@@ -31,18 +25,7 @@ except ImportError:
 
 log = logging.getLogger(__name__)
 
-_cfg_mgr_scheduler = cfg.ConfigManager()
-
-def _load_scheduler_config() -> configparser.ConfigParser:
-    """Loads configuration for scheduler functions."""
-    try:
-        return _cfg_mgr_scheduler.load_config()
-    except exc.ConfigError as e:
-        log.error(f"Scheduler: Failed to load configuration: {e}")
-        raise
-    except Exception as e:
-        log.exception(f"Scheduler: Unexpected error loading configuration: {e}")
-        raise exc.FluxFceError(f"Scheduler: Unexpected error loading configuration: {e}") from e
+_cfg_mgr_scheduler = cfg.get_config_manager()
 
 _sysd_mgr_scheduler = sysd.SystemdManager()
 
@@ -57,23 +40,11 @@ def handle_schedule_dynamic_transitions_command(
     """
     log.info("Scheduler: Handling 'schedule-dynamic-transitions' command...")
     try:
-        current_config = _load_scheduler_config()
-
-        lat_str = current_config.get("Location", "LATITUDE")
-        lon_str = current_config.get("Location", "LONGITUDE")
-        tz_name = current_config.get("Location", "TIMEZONE")
-
-        if not all([lat_str, lon_str, tz_name, 
-                    lat_str != "Not Set", lon_str != "Not Set", tz_name != "Not Set"]):
-            raise exc.ConfigError("Scheduler: Location (latitude, longitude, timezone) not fully configured.")
-
-        lat = helpers.latlon_str_to_float(lat_str)
-        lon = helpers.latlon_str_to_float(lon_str)
-        
         try:
-            local_tz = ZoneInfo(tz_name)
-        except ZoneInfoNotFoundError as e_tz:
-            raise exc.ConfigError(f"Scheduler: Invalid timezone in configuration: {tz_name}") from e_tz
+            lat, lon, tz_name = _cfg_mgr_scheduler.get_location()
+        except exc.ConfigError as e:
+            raise exc.ConfigError(f"Scheduler: {e}") from e
+        local_tz = _cfg_mgr_scheduler.get_zoneinfo()
 
         now_local = datetime.now(local_tz)
         today_local = now_local.date()
@@ -247,13 +218,6 @@ def disable_scheduling() -> bool:
         log.info("Scheduler: Scheduling disabled successfully.")
         return True
 
-    except (exc.SystemdError, exc.FluxFceError) as e:
-        log.error(f"Scheduler: Failed to disable scheduling: {e}")
-        raise
-    except Exception as e:
-        log.exception(f"Scheduler: Unexpected error disabling scheduling: {e}")
-        raise exc.FluxFceError(f"Scheduler: An unexpected error occurred while disabling scheduling: {e}") from e
-
     except (exc.SystemdError, exc.FluxFceError) as e:
         log.error(f"Scheduler: Failed to disable scheduling: {e}")
         raise
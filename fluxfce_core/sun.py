@@ -7,6 +7,7 @@ twilight (sunrise/sunset) times for a given geographic location and date.
 It accounts for timezone conversions to provide local event times.
 """
 
+import functools
 import logging
 import math
 from datetime import date, datetime, timedelta, timezone
@@ -29,6 +30,9 @@ log = logging.getLogger(__name__)
 # --- Internal Sun Calculation Algorithm ---
 
 
+# Pure in (lat, lon, date), so memoized: the scheduler, status and login
+# checks all ask for the same location and day(s) repeatedly.
+@functools.lru_cache(maxsize=16)
 def _noaa_sunrise_sunset(
     *, lat: float, lon: float, target_date: date
 ) -> tuple[float, float]:
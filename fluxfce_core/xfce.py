@@ -22,18 +22,59 @@ XFCONF_THEME_PROPERTY = "/Net/ThemeName"
 XFCONF_WM_THEME_CHANNEL = "xfwm4"
 XFCONF_WM_THEME_PROPERTY = "/general/theme"
 
+# --- xsct Output Patterns ---
+# Combined single-line form, e.g. "Screen 0: temperature ~ 4500 0.85"
+_XSCT_COMBINED_RE = re.compile(r"temperature\s*[~:]?\s*(\d+)\s+([\d.]+)", re.IGNORECASE)
+_XSCT_TEMP_RE = re.compile(r"temperature\s*[~:]?\s*(\d+)", re.IGNORECASE)
+_XSCT_BRIGHT_RE = re.compile(r"brightness\s*[~:]?\s*([\d.]+)", re.IGNORECASE)
+
 
 class XfceHandler:
     """Handles interactions with XFCE GTK theme and xsct."""
 
     def __init__(self):
-        """Check for essential dependencies."""
+        """Check for essential dependencies and open the xfconf channels."""
+        xfconf = helpers.get_xfconf()
         try:
-            # Note: xfconf-query is still needed for themes
+            # xfconf-query is always needed: theme writes go through it.
             helpers.check_dependencies(["xfconf-query", "xsct"])
         except DependencyError as e:
             raise XfceError(f"Cannot initialize XfceHandler: {e}") from e
-
+        # GI channels only in processes that already use gi (the GUI); the
+        # CLI reads through xfconf-query (see helpers.get_xfconf).
+        self._channels: dict[str, Any] = {}
+        if xfconf:
+            self._channels = {
+                name: helpers.get_xfconf_channel(name)
+                for name in (XFCONF_THEME_CHANNEL, XFCONF_WM_THEME_CHANNEL)
+            }
+
+    # --- Private Helpers for xfconf ---
+    def _get_string(self, channel: str, prop: str) -> tuple[str, str]:
+        """Returns (value, error) for a string property; value is '' on failure."""
+        chan = self._channels.get(channel)
+        if chan is not None:
+            value = chan.get_string(prop, "")
+            return value, "" if value else "Empty output"
+        cmd = ["xfconf-query", "-c", channel, "-p", prop]
+        code, stdout, stderr = helpers.run_command(cmd, capture=True)
+        if code != 0 or not stdout:
+            return "", stderr or "Empty output"
+        return stdout, ""
+
+    def _set_string(self, channel: str, prop: str, value: str) -> tuple[bool, str]:
+        """Sets a string property via xfconf-query; returns (success, error)."""
+        chan = self._channels.get(channel)
+        # Reads are served from the channel's local cache, so checking first
+        # saves a spawn (and a theme reload) when the value is unchanged.
+        if chan is not None and chan.get_string(prop, "") == value:
+            log.debug(f"{channel}:{prop} already '{value}'; skipping write.")
+            return True, ""
+        cmd = ["xfconf-query", "-c", channel, "-p", prop, "-s", value]
+        code, _, stderr = helpers.run_command(cmd, capture=True)
+        return code == 0, stderr
+
+    # --- Public API ---
     def get_gtk_theme(self) -> str:
         """
         Gets the current GTK theme name from xfconf.
@@ -42,12 +83,11 @@ class XfceHandler:
         log.debug(
             f"Getting GTK theme from {XFCONF_THEME_CHANNEL} {XFCONF_THEME_PROPERTY}"
         )
-        cmd = ["xfconf-query", "-c", XFCONF_THEME_CHANNEL, "-p", XFCONF_THEME_PROPERTY]
-        code, stdout, stderr = helpers.run_command(cmd, capture=True)
-        if code != 0 or not stdout:
-            raise XfceError(f"Failed to query GTK theme: {stderr or 'Empty output'}")
-        log.info(f"Current GTK theme: {stdout}")
-        return stdout
+        theme, error = self._get_string(XFCONF_THEME_CHANNEL, XFCONF_THEME_PROPERTY)
+        if not theme:
+            raise XfceError(f"Failed to query GTK theme: {error}")
+        log.info(f"Current GTK theme: {theme}")
+        return theme
 
     def set_gtk_theme(self, theme_name: str) -> bool:
         """
@@ -59,32 +99,18 @@ class XfceHandler:
 
         # --- 1. Set GTK Theme (Applications) ---
         log.info(f"Setting GTK (application) theme to: {theme_name}")
-        cmd_gtk = [
-            "xfconf-query",
-            "-c",
-            XFCONF_THEME_CHANNEL,
-            "-p",
-            XFCONF_THEME_PROPERTY,
-            "-s",
-            theme_name,
-        ]
-        code_gtk, _, stderr_gtk = helpers.run_command(cmd_gtk, capture=True)
-        if code_gtk != 0:
+        ok_gtk, stderr_gtk = self._set_string(
+            XFCONF_THEME_CHANNEL, XFCONF_THEME_PROPERTY, theme_name
+        )
+        if not ok_gtk:
             raise XfceError(f"Failed to set GTK theme to '{theme_name}': {stderr_gtk}")
 
         # --- 2. Set Window Manager (XFWM4) Theme ---
         log.info(f"Setting Window Manager (XFWM4) theme to: {theme_name}")
-        cmd_wm = [
-            "xfconf-query",
-            "-c",
-            XFCONF_WM_THEME_CHANNEL,
-            "-p",
-            XFCONF_WM_THEME_PROPERTY,
-            "-s",
-            theme_name,
-        ]
-        code_wm, _, stderr_wm = helpers.run_command(cmd_wm, capture=True)
-        if code_wm != 0:
+        ok_wm, stderr_wm = self._set_string(
+            XFCONF_WM_THEME_CHANNEL, XFCONF_WM_THEME_PROPERTY, theme_name
+        )
+        if not ok_wm:
             # If the WM theme fails, raise an error. The desktop is in an
             # inconsistent state, so this should be treated as a failure.
             # The error message notes the partial success.
@@ -117,10 +143,7 @@ class XfceHandler:
         # --- START: CORRECTED PARSING LOGIC ---
         # 1. Try a combined regex first, which matches the common single-line output format.
         #    e.g., "Screen 0: temperature ~ 4500 0.85"
-        combined_pattern = re.compile(
-            r"temperature\s*[~:]?\s*(\d+)\s+([\d.]+)", re.IGNORECASE
-        )
-        combined_match = combined_pattern.search(stdout)
+        combined_match = _XSCT_COMBINED_RE.search(stdout)
 
         if combined_match:
             log.debug("Parsing xsct output with combined regex pattern.")
@@ -141,11 +164,8 @@ class XfceHandler:
         log.debug(
             "Combined regex failed or was incomplete. Trying separate regex patterns as a fallback."
         )
-        temp_pattern = re.compile(r"temperature\s*[~:]?\s*(\d+)", re.IGNORECASE)
-        bright_pattern = re.compile(r"brightness\s*[~:]?\s*([\d.]+)", re.IGNORECASE)
-
-        temp_match = temp_pattern.search(stdout)
-        bright_match = bright_pattern.search(stdout)
+        temp_match = _XSCT_TEMP_RE.search(stdout)
+        bright_match = _XSCT_BRIGHT_RE.search(stdout)
 
         if temp_match:
             try:
@@ -10,6 +10,7 @@ with a system tray status icon.
 """
 
 import logging
+import signal
 import subprocess
 import sys
 from datetime import datetime
@@ -28,6 +29,7 @@ except (ImportError, ValueError):
 
 try:
     import fluxfce_core
+    from fluxfce_core import config as core_config
     from fluxfce_core import exceptions as core_exc
     from fluxfce_core import xfce
 except ImportError as e:
@@ -44,7 +46,7 @@ APP_SCRIPT_PATH = Path(__file__).resolve()
 SLIDER_DEBOUNCE_MS = 200
 UI_UPDATE_DELAY_MS = 250
 UI_REFRESH_INTERVAL_MS = 60 * 1000  # 1 minute
-ASSETS_DIR = Path(__file__).resolve().parent / "fluxfce_core" / "assets"
+ASSETS_DIR = APP_SCRIPT_PATH.parent / "fluxfce_core" / "assets"
 ICON_ENABLED = str(ASSETS_DIR / "icon-enabled.png")
 ICON_DISABLED = str(ASSETS_DIR / "icon-disabled.png")
 
@@ -194,6 +196,9 @@ class FluxFceWindow(Gtk.Window):
         self.temp_slider_handler_id = None
         self.bright_slider_handler_id = None
         self.slider_debounce_id = None
+        # (temp, brightness to 0.01) last known to be on screen; xsct is only
+        # invoked when the sliders settle on something different.
+        self.applied_screen = None
         self.periodic_refresh_id = None
         self.one_shot_refresh_id = None
         self._last_height = None
@@ -496,14 +501,18 @@ class FluxFceWindow(Gtk.Window):
         if mode == "day":
             profile_name = config.get("day_bg_profile", "N/A")
             theme = config.get("light_theme", "N/A")
-            temp, bright = config_parser.get("ScreenDay", "XSCT_TEMP", fallback=""), config_parser.get("ScreenDay", "XSCT_BRIGHT", fallback="")
+            section = "ScreenDay"
             lbl_screen_value, lbl_theme_value, lbl_background_value = self.lbl_day_screen, self.lbl_day_theme, self.lbl_day_background
         else: # night
             profile_name = config.get("night_bg_profile", "N/A")
             theme = config.get("dark_theme", "N/A")
-            temp, bright = config_parser.get("ScreenNight", "XSCT_TEMP", fallback=""), config_parser.get("ScreenNight", "XSCT_BRIGHT", fallback="")
+            section = "ScreenNight"
             lbl_screen_value, lbl_theme_value, lbl_background_value = self.lbl_night_screen, self.lbl_night_theme, self.lbl_night_background
 
+        # One raw items() pass for the section instead of a get() per option.
+        screen = dict(config_parser.items(section, raw=True)) if config_parser.has_section(section) else {}
+        temp, bright = screen.get("xsct_temp", ""), screen.get("xsct_bright", "")
+
         # --- Set Screen Label ---
         temp_str = f"{temp} K" if temp else "Default"
         bright_str = f"{float(bright):.0%}" if bright else "Default"
@@ -529,6 +538,7 @@ class FluxFceWindow(Gtk.Window):
             self.lbl_temp_readout.set_text(f"{int(temp)} K")
             self.slider_bright.get_adjustment().set_value(bright)
             self.lbl_bright_readout.set_text(f"{bright:.0%}")
+            self.applied_screen = (int(temp), round(bright, 2))
         except core_exc.XfceError as e:
             log.error(f"Could not get screen settings: {e}")
         finally:
@@ -622,8 +632,13 @@ class FluxFceWindow(Gtk.Window):
 
     def _apply_slider_values(self):
         temp, bright = int(self.slider_temp.get_value()), self.slider_bright.get_value()
+        target = (temp, round(bright, 2))  # xsct takes brightness to 2 decimals
+        if target == self.applied_screen:
+            self.slider_debounce_id = None
+            return GLib.SOURCE_REMOVE
         try:
             self.xfce_handler.set_screen_temp(temp, bright)
+            self.applied_screen = target
         except (core_exc.XfceError, ValueError) as e:
             self.show_error_dialog("Apply Error", f"Failed to set screen values: {e}")
         self.slider_debounce_id = None
@@ -827,6 +842,14 @@ class Application:
         self.toggle_item = None
         self.window = FluxFceWindow(self)
         self._init_status_icon()
+        # `kill -HUP` makes a running GUI drop its cached config.ini.
+        GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGHUP, self._on_sighup)
+
+    def _on_sighup(self):
+        log.info("SIGHUP received; reloading configuration.")
+        core_config.invalidate_cache()
+        self.window.refresh_ui()
+        return GLib.SOURCE_CONTINUE
 
       
     def _init_status_icon(self):